@@ -34,7 +34,12 @@ from vtkmodules.vtkRenderingCore import (
 )
 
 from vtkmodules.vtkFiltersExtraction import vtkExtractCellsByType
-from vtkmodules.vtkCommonDataModel import VTK_TRIANGLE, VTK_LINE, VTK_VERTEX
+from vtkmodules.vtkCommonDataModel import (
+    VTK_TRIANGLE,
+    VTK_LINE,
+    VTK_VERTEX,
+    vtkPolyData,
+)
 
 from .geom import Location
 from .shapes import Shape, Solid, Compound
@@ -271,11 +276,9 @@ def _loc2vtk(
     T = loc.wrapped.Transformation()
 
     trans = T.TranslationPart().Coord()
-    rot = tuple(
-        map(degrees, T.GetRotation().GetEulerAngles(gp_EulerSequence.gp_Intrinsic_ZXY),)
-    )
+    rz, rx, ry = T.GetRotation().GetEulerAngles(gp_EulerSequence.gp_Intrinsic_ZXY)
 
-    return trans, (rot[1], rot[2], rot[0])
+    return trans, (degrees(rx), degrees(ry), degrees(rz))
 
 
 def toVTK(
@@ -287,58 +290,97 @@ def toVTK(
 
     renderer = vtkRenderer()
 
-    for shape, _, loc, col_ in assy:
+    # mappers of the tessellated objects, shared by all instances of an object in the assy
+    mappers: Dict[Tuple[AssemblyObjects, Any], Tuple[vtkMapper, vtkMapper]] = {}
+
+    # extraction filters, reused for all objects
+    extr_edges = vtkExtractCellsByType()
+    extr_edges.AddCellType(VTK_LINE)
+    extr_edges.AddCellType(VTK_VERTEX)
+
+    extr_faces = vtkExtractCellsByType()
+    extr_faces.AddCellType(VTK_TRIANGLE)
 
-        col = col_.toTuple() if col_ else color
+    def _toVTK(el: AssemblyProtocol, loc: Location, color_: Optional[Color]):
 
-        trans, rot = _loc2vtk(loc)
+        # define the current location and color
+        current_loc = loc * el.loc
+        current_color = el.color if el.color else color_
 
-        data = shape.toVtkPolyData(tolerance, angularTolerance)
+        if el.obj:
+            col = current_color.toTuple() if current_color else color
+
+            trans, rot = _loc2vtk(current_loc)
 
-        # extract faces
-        extr = vtkExtractCellsByType()
-        extr.SetInputDataObject(data)
+            # NB: orientation is part of the key, reversed shapes have flipped normals
+            key = (
+                el.obj,
+                el.obj.wrapped.Orientation() if isinstance(el.obj, Shape) else None,
+            )
+
+            if key in mappers:
+                mapper_faces, mapper_edges = mappers[key]
+            else:
+                shape = (
+                    el.obj
+                    if isinstance(el.obj, Shape)
+                    else Compound.makeCompound(el.shapes)
+                )
+                data = shape.toVtkPolyData(tolerance, angularTolerance)
 
-        extr.AddCellType(VTK_LINE)
-        extr.AddCellType(VTK_VERTEX)
-        extr.Update()
-        data_edges = extr.GetOutput()
+                # extract edges - normals are removed before so that they are not copied
+                edges = vtkPolyData()
+                edges.ShallowCopy(data)
+                edges.GetPointData().RemoveArray("Normals")
 
-        # extract edges
-        extr = vtkExtractCellsByType()
-        extr.SetInputDataObject(data)
+                extr_edges.SetInputDataObject(edges)
+                extr_edges.Update()
 
-        extr.AddCellType(VTK_TRIANGLE)
-        extr.Update()
-        data_faces = extr.GetOutput()
+                # NB: the outputs are reused by the next update, so a copy is needed
+                data_edges = vtkPolyData()
+                data_edges.ShallowCopy(extr_edges.GetOutput())
 
-        # remove normals from edges
-        data_edges.GetPointData().RemoveArray("Normals")
+                # extract faces
+                extr_faces.SetInputDataObject(data)
+                extr_faces.Update()
 
-        # add both to the renderer
-        mapper = vtkMapper()
-        mapper.AddInputDataObject(data_faces)
+                data_faces = vtkPolyData()
+                data_faces.ShallowCopy(extr_faces.GetOutput())
 
-        actor = vtkActor()
-        actor.SetMapper(mapper)
-        actor.SetPosition(*trans)
-        actor.SetOrientation(*rot)
-        actor.GetProperty().SetColor(*col[:3])
-        actor.GetProperty().SetOpacity(col[3])
+                # mappers are shared between all instances of the object
+                mapper_faces = vtkMapper()
+                mapper_faces.AddInputDataObject(data_faces)
 
-        renderer.AddActor(actor)
+                mapper_edges = vtkMapper()
+                mapper_edges.AddInputDataObject(data_edges)
 
-        mapper = vtkMapper()
-        mapper.AddInputDataObject(data_edges)
+                mappers[key] = (mapper_faces, mapper_edges)
 
-        actor = vtkActor()
-        actor.SetMapper(mapper)
-        actor.SetPosition(*trans)
-        actor.SetOrientation(*rot)
-        actor.GetProperty().SetColor(0, 0, 0)
-        actor.GetProperty().SetLineWidth(2)
+            # add both to the renderer
+            actor = vtkActor()
+            actor.SetMapper(mapper_faces)
+            actor.SetPosition(*trans)
+            actor.SetOrientation(*rot)
+            actor.GetProperty().SetColor(*col[:3])
+            actor.GetProperty().SetOpacity(col[3])
 
-        renderer.AddActor(actor)
+            renderer.AddActor(actor)
+
+            actor = vtkActor()
+            actor.SetMapper(mapper_edges)
+            actor.SetPosition(*trans)
+            actor.SetOrientation(*rot)
+            actor.GetProperty().SetColor(0, 0, 0)
+            actor.GetProperty().SetLineWidth(2)
+
+            renderer.AddActor(actor)
+
+        # add children recursively
+        for child in el.children:
+            _toVTK(child, current_loc, current_color)
+
+    # process the whole assy recursively
+    _toVTK(assy, Location(), None)
 
     return renderer
 
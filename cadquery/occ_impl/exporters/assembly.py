@@ -1,8 +1,8 @@
-import os.path
+import os
 import uuid
 
 from tempfile import TemporaryDirectory
-from shutil import make_archive
+from zipfile import ZipFile, ZIP_DEFLATED
 from itertools import chain
 from typing import Optional
 from typing_extensions import Literal
@@ -164,7 +164,13 @@ def exportVTKJS(assy: AssemblyProtocol, path: str):
         exporter.SetFileName(tmpdir)
         exporter.SetRenderWindow(renderWindow)
         exporter.Write()
-        make_archive(path, "zip", tmpdir)
+
+        # use fast compression - the scene consists mostly of binary arrays
+        with ZipFile(f"{path}.zip", "w", ZIP_DEFLATED, compresslevel=1) as archive:
+            for root, _, files in os.walk(tmpdir):
+                for f in files:
+                    fpath = os.path.join(root, f)
+                    archive.write(fpath, os.path.relpath(fpath, tmpdir))
 
 
 def exportVRML(
@@ -209,14 +215,15 @@ def exportGLTF(
     orig_loc = assy.loc
     assy.loc *= Location((0, 0, 0), (1, 0, 0), -90)
 
-    _, doc = toCAF(assy, True, True, tolerance, angularTolerance)
+    try:
+        _, doc = toCAF(assy, True, True, tolerance, angularTolerance)
+    finally:
+        # restore coordinate system, also if the conversion fails
+        assy.loc = orig_loc
 
     writer = RWGltf_CafWriter(TCollection_AsciiString(path), binary)
     result = writer.Perform(
         doc, TColStd_IndexedDataMapOfStringString(), Message_ProgressRange()
     )
 
-    # restore coordinate system after exporting
-    assy.loc = orig_loc
-
     return result
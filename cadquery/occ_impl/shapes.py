@@ -1397,13 +1397,19 @@ class Shape(object):
 
             yield dist_calc.Value()
 
-    def mesh(self, tolerance: float, angularTolerance: float = 0.1):
+    def mesh(
+        self, tolerance: float, angularTolerance: float = 0.1, parallel: bool = True
+    ):
         """
         Generate triangulation if none exists.
+
+        :param parallel: If True, OCCT will use parallel processing to mesh the shape. Default is True.
         """
 
         if not BRepTools.Triangulation_s(self.wrapped, tolerance):
-            BRepMesh_IncrementalMesh(self.wrapped, tolerance, True, angularTolerance)
+            BRepMesh_IncrementalMesh(
+                self.wrapped, tolerance, True, angularTolerance, parallel
+            )
 
     def tessellate(
         self, tolerance: float, angularTolerance: float = 0.1
@@ -6,7 +6,9 @@ import copy
 from path import Path
 from pathlib import PurePath
 import re
+import json
 from pytest import approx
+from zipfile import ZipFile
 
 import cadquery as cq
 from cadquery.occ_impl.exporters.assembly import (
@@ -15,10 +17,10 @@ from cadquery.occ_impl.exporters.assembly import (
     exportVTKJS,
     exportVRML,
 )
-from cadquery.occ_impl.assembly import toJSON, toCAF, toFusedCAF
+from cadquery.occ_impl.assembly import toJSON, toCAF, toFusedCAF, toVTK
 from cadquery.occ_impl.shapes import Face, box
 
-from OCP.gp import gp_XYZ
+from OCP.gp import gp_XYZ, gp_Trsf, gp_Vec, gp_Quaternion
 from OCP.TDocStd import TDocStd_Document
 from OCP.TDataStd import TDataStd_Name
 from OCP.TCollection import TCollection_ExtendedString
@@ -649,6 +651,10 @@ def test_vtkjs_export(nested_assy):
     # only sanity check for now
     assert os.path.exists("assy.zip")
 
+    # scene description is stored at the root of the archive
+    with ZipFile("assy.zip") as archive:
+        assert "index.json" in archive.namelist()
+
 
 def test_vrml_export(simple_assy):
 
@@ -669,6 +675,75 @@ def test_toJSON(simple_assy, nested_assy, empty_top_assy):
     assert len(r3) == 1
 
 
+def test_toVTK():
+
+    b = cq.Solid.makeBox(1, 1, 1)
+
+    assy = cq.Assembly()
+    assy.add(b, name="b1")
+    assy.add(b, name="b2", loc=cq.Location(cq.Vector(0, 0, 2)))
+
+    renderer = toVTK(assy)
+    actors = list(renderer.GetActors())
+
+    # face and edge actor per instance
+    assert len(actors) == 4
+
+    # tessellation and mappers are shared between the instances
+    assert actors[0].GetMapper() is actors[2].GetMapper()
+    assert actors[1].GetMapper() is actors[3].GetMapper()
+
+    # faces are compacted and keep the cell data
+    data_faces = actors[0].GetMapper().GetInput()
+    assert data_faces.GetNumberOfPoints() == 24
+    assert data_faces.GetNumberOfCells() == 12
+    assert data_faces.GetNumberOfPolys() == 12
+    assert data_faces.GetPointData().GetArray("Normals") is not None
+    assert data_faces.GetCellData().GetArray("SUBSHAPE_IDS") is not None
+    assert data_faces.GetCellData().GetArray("MESH_TYPES") is not None
+
+    # edges carry no normals but keep the cell data
+    data_edges = actors[1].GetMapper().GetInput()
+    assert data_edges.GetPointData().GetArray("Normals") is None
+    assert data_edges.GetNumberOfCells() > 0
+    assert data_edges.GetNumberOfPolys() == 0
+    assert data_edges.GetCellData().GetArray("SUBSHAPE_IDS") is not None
+    assert data_edges.GetCellData().GetArray("MESH_TYPES") is not None
+
+    # the normals of the tessellation are not affected
+    assert data_faces.GetPointData().GetArray("Normals") is not None
+
+
+def test_toVTK_workplane():
+
+    w = cq.Workplane().box(1, 1, 1)
+
+    assy = cq.Assembly()
+    assy.add(w, name="w1")
+    assy.add(w, name="w2", loc=cq.Location(cq.Vector(0, 0, 2)))
+
+    actors = list(toVTK(assy).GetActors())
+
+    assert len(actors) == 4
+    assert actors[0].GetMapper() is actors[2].GetMapper()
+    assert actors[1].GetMapper() is actors[3].GetMapper()
+
+
+def test_toVTK_reversed():
+
+    b = cq.Solid.makeBox(1, 1, 1)
+
+    assy = cq.Assembly()
+    assy.add(b, name="b")
+    assy.add(cq.Shape.cast(b.wrapped.Reversed()), name="r")
+
+    actors = list(toVTK(assy).GetActors())
+
+    # reversed shapes are tessellated separately
+    assert len(actors) == 4
+    assert actors[0].GetMapper() is not actors[2].GetMapper()
+
+
 @pytest.mark.parametrize(
     "extension, args",
     [
@@ -791,6 +866,62 @@ def test_exportGLTF(nested_assy_sphere):
         assert lines[0].startswith('{"accessors"')
 
 
+def _gltf_mesh_locs(gltf):
+    """
+    Compose the node transformations of a glTF scene and return the
+    global locations of the nodes that reference a mesh.
+    """
+
+    nodes = gltf["nodes"]
+    rv = []
+
+    def _visit(ix, parent):
+
+        node = nodes[ix]
+
+        T = gp_Trsf()
+        if "rotation" in node:
+            T.SetRotation(gp_Quaternion(*node["rotation"]))
+        if "translation" in node:
+            T.SetTranslationPart(gp_Vec(*node["translation"]))
+
+        loc = parent * cq.Location(T)
+
+        if "mesh" in node:
+            rv.append(loc)
+
+        for ch in node.get("children", []):
+            _visit(ch, loc)
+
+    for ix in gltf["scenes"][gltf.get("scene", 0)]["nodes"]:
+        _visit(ix, cq.Location())
+
+    return rv
+
+
+def test_exportGLTF_coordinate_system(tmpdir):
+    """+Z up in CadQuery must map to +Y up in glTF."""
+
+    assy = cq.Assembly(name="top")
+    assy.add(box(1, 1, 1), name="box", loc=cq.Location(cq.Vector(0, 0, 5)))
+
+    loc = assy.loc
+    path = str(Path(tmpdir) / "box.gltf")
+    cq.exporters.assembly.exportGLTF(assy, path)
+
+    # the assy is not modified
+    assert assy.loc is loc
+    assert assy.loc.toTuple() == cq.Location().toTuple()
+
+    with open(path) as f:
+        locs = _gltf_mesh_locs(json.load(f))
+
+    assert len(locs) == 1
+
+    T, _ = locs[0].toTuple()
+    assert T == approx((0, 5, 0))
+
+
 def test_save_gltf_boxes2(boxes2_assy, tmpdir, capfd):
     """
     Output must not contain:
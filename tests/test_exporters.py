@@ -36,6 +36,7 @@ from cadquery.occ_impl.exporters.dxf import DxfDocument
 from tests import BaseTest
 from OCP.GeomConvert import GeomConvert
 from OCP.BRepBuilderAPI import BRepBuilderAPI_MakeEdge
+from OCP.BRepTools import BRepTools
 
 
 @pytest.fixture(scope="module")
@@ -856,6 +857,15 @@ def test_tessellate(box123):
     assert len(triangles) == 12
 
 
+def test_mesh(box123):
+
+    box = box123.val()
+    assert not BRepTools.Triangulation_s(box.wrapped, 1e-3)
+
+    box.mesh(1e-3)
+    assert BRepTools.Triangulation_s(box.wrapped, 1e-3)
+
+
 def _dxf_spline_max_degree(fname):
 
     dxf = ezdxf.readfile(fname)